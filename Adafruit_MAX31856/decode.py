@@ -0,0 +1,151 @@
+"""
+decode.py
+
+Conversion of raw MAX31856 temperature register bytes in bulk, for readings which are logged as
+raw bytes and decoded later rather than as they are read.
+
+The conversions are compiled with numba when it is installed, otherwise the same functions run
+as plain Python.  decode_therm_arr() and decode_therm_batch() require numpy.
+
+Copyright (c) 2019 John Robinson
+Author: John Robinson
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+try:
+    import numpy
+except ImportError:
+    numpy = None
+try:
+    import numba
+except ImportError:
+    numba = None
+
+from .max31856 import MAX31856
+
+# Module level copies, numba freezes global values into the compiled code
+_THERM_LSB = MAX31856.MAX31856_CONST_THERM_LSB
+_THERM_SIGN = 1 << (MAX31856.MAX31856_CONST_THERM_BITS - 1)
+_CJ_LSB = MAX31856.MAX31856_CONST_CJ_LSB
+_CJ_SIGN = 1 << (MAX31856.MAX31856_CONST_CJ_BITS - 1)
+
+
+def _jit(**options):
+    """Compile the decorated function with numba.njit if numba is available.
+    """
+    if numba is None:
+        return lambda func: func
+    return numba.njit(**options)
+
+
+@_jit(cache=True)
+def decode_therm(hi, mid, lo):
+    """
+    Converts the LTCBH, LTCBM, LTCBL register values to a thermocouple temperature.
+
+    Args:
+        hi (integer): LTCBH register value
+        mid (integer): LTCBM register value
+        lo (integer): LTCBL register value
+
+    Returns:
+        (float): Temperature in degrees celsius
+    """
+    raw = ((int(hi) << 16) | (int(mid) << 8) | int(lo)) >> 5
+    raw -= (raw & _THERM_SIGN) << 1
+    return raw*_THERM_LSB
+
+
+@_jit(cache=True)
+def decode_cj(hi, lo):
+    """
+    Converts the CJTH, CJTL register values to a cold junction temperature.
+
+    Args:
+        hi (integer): CJTH register value
+        lo (integer): CJTL register value
+
+    Returns:
+        (float): Temperature in degrees celsius
+    """
+    raw = ((int(hi) << 8) | int(lo)) >> 2
+    raw -= (raw & _CJ_SIGN) << 1
+    return raw*_CJ_LSB
+
+
+def _decode_therm_np(arr_hi, arr_mid, arr_lo):
+    """
+    Converts arrays of LTCBH, LTCBM, LTCBL register values to thermocouple temperatures, using
+    numpy array operations rather than a Python loop.
+
+    Returns:
+        (numpy.ndarray): float64 temperatures in degrees celsius
+    """
+    raw = ((numpy.asarray(arr_hi, dtype=numpy.int32) << 16)
+           | (numpy.asarray(arr_mid, dtype=numpy.int32) << 8)
+           | numpy.asarray(arr_lo, dtype=numpy.int32)) >> 5
+    raw -= (raw & _THERM_SIGN) << 1
+    return raw*_THERM_LSB
+
+
+if numba is None:
+    def decode_therm_arr(arr_hi, arr_mid, arr_lo):
+        """
+        Converts arrays of LTCBH, LTCBM, LTCBL register values to thermocouple temperatures.
+
+        Returns:
+            (numpy.ndarray): float64 temperatures in degrees celsius
+        """
+        if numpy is None:
+            raise ImportError('decode_therm_arr() requires numpy')
+        return _decode_therm_np(arr_hi, arr_mid, arr_lo)
+else:
+    @numba.njit(cache=True, parallel=True)
+    def decode_therm_arr(arr_hi, arr_mid, arr_lo):
+        """
+        Converts arrays of LTCBH, LTCBM, LTCBL register values to thermocouple temperatures,
+        spreading the samples across threads.
+
+        Returns:
+            (numpy.ndarray): float64 temperatures in degrees celsius
+        """
+        out = numpy.empty(arr_hi.shape[0])
+        for i in numba.prange(arr_hi.shape[0]):
+            out[i] = decode_therm(arr_hi[i], arr_mid[i], arr_lo[i])
+        return out
+
+
+def decode_therm_batch(raw_bytes):
+    """
+    Converts a buffer of consecutive LTCBH, LTCBM, LTCBL register samples to thermocouple
+    temperatures, using numpy array operations rather than a Python loop.
+
+    Args:
+        raw_bytes (bytes): 3*N bytes, each sample most significant byte first
+
+    Returns:
+        (numpy.ndarray): N float32 temperatures in degrees celsius
+    """
+    if numpy is None:
+        raise ImportError('decode_therm_batch() requires numpy')
+    if len(raw_bytes) % 3:
+        raise ValueError('Buffer length must be a multiple of 3 bytes!')
+
+    arr = numpy.frombuffer(raw_bytes, dtype=numpy.uint8).reshape(-1, 3)
+    return _decode_therm_np(arr[:, 0], arr[:, 1], arr[:, 2]).astype(numpy.float32)
@@ -24,23 +24,263 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 THE SOFTWARE.
 """
+import asyncio
+import collections
 import logging
+import threading
+import time
 import warnings
 
 import Adafruit_GPIO as Adafruit_GPIO
 import Adafruit_GPIO.SPI as SPI
 
+try:
+    import pigpio
+except ImportError:
+    pigpio = None
+
+# Result of MAX31856.read_temperatures(), temperatures are in degrees celsius and fault is the
+#   raw fault status register.
+Reading = collections.namedtuple('Reading', 'thermocouple cold_junction fault')
+
+# Raised as a RuntimeError when an SPI transfer returns fewer bytes than were clocked
+_SHORT_READ_ERROR = 'Did not read expected number of bytes from device!'
+
+# Platform GPIO shared by all sensors, see _get_gpio()
+_PLATFORM_GPIO = None
+
+
+def _get_gpio():
+    """Return the platform GPIO, detecting the platform on first use only.
+
+    Adafruit_GPIO.get_platform_gpio() probes the board and imports its GPIO module on every call.
+    """
+    global _PLATFORM_GPIO  # pylint: disable-msg=global-statement
+    if _PLATFORM_GPIO is None:
+        _PLATFORM_GPIO = Adafruit_GPIO.get_platform_gpio()
+    return _PLATFORM_GPIO
+
+# Software SPI bus locks, keyed by GPIO and clock pin, see _BitBang
+_BITBANG_LOCKS = {}
+
+
+class _BitBang(SPI.BitBang):
+    """Software SPI implementation with a faster full-duplex transfer.
+
+    Adafruit_GPIO.SPI.BitBang.transfer() looks up the GPIO methods, pins and shift operators for
+    every bit clocked.  This subclass binds them once per transfer and walks a bit mask instead,
+    which noticeably shortens each software SPI read.  Only MSB first bit order is specialized,
+    which is the order the MAX31856 uses, anything else falls back to the base implementation.
+
+    Sensors sharing the clock pin of a GPIO share the bus, so transfers hold a lock per GPIO and
+    clock pin to stop two threads (e.g. the executor running read_temp_c_async()) clocking the pins
+    at the same time.
+    """
+
+    _BIT_MASKS = (0x80, 0x40, 0x20, 0x10, 0x08, 0x04, 0x02, 0x01)
+
+    def __init__(self, gpio, sclk, mosi=None, miso=None, ss=None):
+        SPI.BitBang.__init__(self, gpio, sclk, mosi, miso, ss)
+        self._lock = _BITBANG_LOCKS.setdefault((gpio, sclk), threading.Lock())
+
+    def write(self, data, assert_ss=True, deassert_ss=True):
+        """Half-duplex SPI write, see Adafruit_GPIO.SPI.BitBang.write().
+        """
+        with self._lock:
+            SPI.BitBang.write(self, data, assert_ss, deassert_ss)
+
+    def transfer(self, data, assert_ss=True, deassert_ss=True):
+        """Full-duplex SPI read and write, see Adafruit_GPIO.SPI.BitBang.transfer().
+        """
+        with self._lock:
+            if self._mask != 0x80:
+                return SPI.BitBang.transfer(self, data, assert_ss, deassert_ss)
+            return self._transfer_msb_first(data, assert_ss, deassert_ss)
+
+    def _transfer_msb_first(self, data, assert_ss, deassert_ss):
+        """Full-duplex SPI read and write, MSB first.
+        """
+        if self._mosi is None:
+            raise RuntimeError('Write attempted with no MOSI pin specified.')
+        if self._miso is None:
+            raise RuntimeError('Read attempted with no MISO pin specified.')
+
+        output = self._gpio.output
+        is_high = self._gpio.is_high
+        sclk, mosi, miso, ss = self._sclk, self._mosi, self._miso, self._ss
+        clock_base = self._clock_base
+        clock_active = not clock_base
+        read_leading = self._read_leading
+
+        if assert_ss and ss is not None:
+            self._gpio.set_low(ss)
+        result = bytearray(len(data))
+        for i, byte in enumerate(data):
+            value = 0
+            for mask in self._BIT_MASKS:
+                output(mosi, bool(byte & mask))
+                output(sclk, clock_active)
+                if read_leading and is_high(miso):
+                    value |= mask
+                output(sclk, clock_base)
+                if not read_leading and is_high(miso):
+                    value |= mask
+            result[i] = value
+        if deassert_ss and ss is not None:
+            self._gpio.set_high(ss)
+        return result
+
+
+class _PigpioBitBang(object):
+    """Software SPI using the bit banged SPI of the pigpio daemon.
+
+    Adafruit_GPIO.SPI.BitBang toggles every clock edge from Python through the GPIO library, while
+    pigpio's bb_spi_xfer() clocks the whole transfer inside the daemon, using direct access to the
+    GPIO registers.  The trade off is that the pigpiod daemon must be running, and the clock is
+    limited to the daemon's bit bang maximum of 250kHz (still well above the Python bit bang rate).
+    """
+
+    MAX_BAUD = 250000
+
+    def __init__(self, pi, sclk, mosi, miso, ss):
+        self._pi = pi
+        self._sclk = sclk
+        self._mosi = mosi
+        self._miso = miso
+        self._ss = ss
+        self._baud = self.MAX_BAUD
+        self._flags = 0
+        self._open = False
+        # Settings are applied by reopening the bit bang SPI, deferred until the next transfer
+        self._stale = True
+
+    def _reopen(self):
+        """(Re)open the pigpio bit bang SPI with the current settings.
+        """
+        if self._open:
+            self._pi.bb_spi_close(self._ss)
+        self._pi.bb_spi_open(self._ss, self._miso, self._mosi, self._sclk, self._baud, self._flags)
+        self._open = True
+        self._stale = False
+
+    def set_clock_hz(self, hz):
+        """Set the speed of the SPI clock, limited to the pigpio bit bang maximum.
+        """
+        self._baud = min(hz, self.MAX_BAUD)
+        self._stale = True
+
+    def set_mode(self, mode):
+        """Set SPI mode (0-3), which controls clock polarity and phase.
+        """
+        if mode < 0 or mode > 3:
+            raise ValueError('Mode must be a value 0, 1, 2, or 3.')
+        self._flags = (self._flags & ~0x3) | mode
+        self._stale = True
+
+    def set_bit_order(self, order):
+        """Set order of bits, SPI.MSBFIRST or SPI.LSBFIRST.
+        """
+        # bb_spi_open() flags bit 14 sets LSB first transmit, bit 15 LSB first receive
+        if order == SPI.MSBFIRST:
+            self._flags &= ~0xC000
+        elif order == SPI.LSBFIRST:
+            self._flags |= 0xC000
+        else:
+            raise ValueError('Order must be MSBFIRST or LSBFIRST.')
+        self._stale = True
+
+    def close(self):
+        """Close the bit bang SPI and the connection to the pigpio daemon."""
+        if self._open:
+            self._pi.bb_spi_close(self._ss)
+            self._open = False
+        self._pi.stop()
+
+    def write(self, data):
+        """Half-duplex SPI write, the bytes read back are discarded.
+        """
+        self.transfer(data)
+
+    def transfer(self, data):
+        """Full-duplex SPI read and write, see Adafruit_GPIO.SPI.BitBang.transfer().
+        """
+        if self._stale:
+            self._reopen()
+        count, result = self._pi.bb_spi_xfer(self._ss, bytes(data))
+        if count < 0:
+            raise RuntimeError('pigpio bit bang SPI transfer failed with error {0}!'.format(count))
+        return result
+
+
+class _SpiDev(object):
+    """Hardware SPI directly on the Linux spidev driver.
+
+    Same interface as Adafruit_GPIO.SPI.SpiDev, but transfer is the driver's own xfer2 rather than
+    a wrapper around it, so burst reads skip a Python call and a result copy.  The device is opened
+    already configured for the MAX31856 (SPI mode 1, 8 bits per word).
+    """
+
+    def __init__(self, port, device, max_speed_hz=5000000):
+        import spidev
+        self._device = spidev.SpiDev()
+        self._device.open(port, device)
+        self._device.max_speed_hz = max_speed_hz
+        self._device.mode = 1
+        self._device.bits_per_word = 8
+        self._device.lsbfirst = False
+        self.transfer = self._device.xfer2
+        self.write = self._device.writebytes
+
+    def set_clock_hz(self, hz):
+        """Set the speed of the SPI clock in hertz.
+        """
+        self._device.max_speed_hz = hz
+
+    def set_mode(self, mode):
+        """Set SPI mode (0-3), which controls clock polarity and phase.
+        """
+        if mode < 0 or mode > 3:
+            raise ValueError('Mode must be a value 0, 1, 2, or 3.')
+        self._device.mode = mode
+
+    def get_mode(self):
+        """Return the SPI mode the device is configured with.
+        """
+        return self._device.mode
+
+    def set_bit_order(self, order):
+        """Set order of bits, SPI.MSBFIRST or SPI.LSBFIRST.
+        """
+        if order not in (SPI.MSBFIRST, SPI.LSBFIRST):
+            raise ValueError('Order must be MSBFIRST or LSBFIRST.')
+        self._device.lsbfirst = order == SPI.LSBFIRST
+
+    def close(self):
+        """Close communication with the SPI device."""
+        self._device.close()
+
 
 class MAX31856(object):
     """Class to represent an Adafruit MAX31856 thermocouple temperature
     measurement board.
     """
 
+    # Instance attributes, declared to avoid a per-instance __dict__ (useful with many sensors)
+    __slots__ = ('_logger', '_spi', '_transfer', '_write', '_logger_debug', '_tx2', '_tx_bursts',
+                 '_tx_temp_c', '_temp_c_cache', '_temp_c_lock', '_gpio', '_drdy', 'tc_type', 'avgsel',
+                 'cr1')
+
     # Board Specific Constants
     MAX31856_CONST_THERM_LSB = 2**-7
     MAX31856_CONST_THERM_BITS = 19
     MAX31856_CONST_CJ_LSB = 2**-6
     MAX31856_CONST_CJ_BITS = 14
+    MAX31856_CONST_CONT_CACHE_S = 0.09 # Continuous mode updates approx. every 100ms
+    MAX31856_CONST_SPI_HZ = 5000000 # Maximum SPI clock, 5MHz
+    MAX31856_CONST_SPI_MODE = 1 # CPOL = 0, CPHA = 1
+    MAX31856_CONST_CONV_S = 0.1 # Continuous mode conversion time, single sample
+    MAX31856_CONST_AVG_CONV_S = 0.04 # Added conversion time per additional averaged sample
+    MAX31856_CONST_DRDY_POLL_S = 0.001 # Interval between DRDY pin checks
 
     ### Register constants, see data sheet Table 6 (in Rev. 0) for info.
     # Read Addresses
@@ -79,6 +319,18 @@ class MAX31856(object):
     MAX31856_CR0_READ_ONE = 0x40 # One shot reading, delay approx. 200ms then read temp registers
     MAX31856_CR0_READ_CONT = 0x80 # Continuous reading, delay approx. 100ms between readings
 
+    # Fault Status Register (SR) bits, see data sheet Table 6 (in Rev. 0)
+    MAX31856_FAULT_BITS = (
+        ('cj_out_of_range', 0x80),      # Cold-Junction temperature outside operating range
+        ('tc_out_of_range', 0x40),      # Thermocouple temperature outside its type's range
+        ('cj_high', 0x20),              # Cold-Junction temperature above high threshold
+        ('cj_low', 0x10),               # Cold-Junction temperature below low threshold
+        ('tc_high', 0x08),              # Thermocouple temperature above high threshold
+        ('tc_low', 0x04),               # Thermocouple temperature below low threshold
+        ('over_under_voltage', 0x02),   # Input over or under voltage
+        ('open_circuit', 0x01),         # Thermocouple open circuit
+    )
+
     # Thermocouple Types
     MAX31856_B_TYPE = 0x0 # Read B Type Thermocouple
     MAX31856_E_TYPE = 0x1 # Read E Type Thermocouple
@@ -89,11 +341,13 @@ class MAX31856(object):
     MAX31856_S_TYPE = 0x6 # Read S Type Thermocouple
     MAX31856_T_TYPE = 0x7 # Read T Type Thermocouple
 
-    def __init__(self, tc_type=MAX31856_T_TYPE, avgsel=0x0, software_spi=None, hardware_spi=None, gpio=None):
+    def __init__(self, tc_type=MAX31856_T_TYPE, avgsel=0x0, software_spi=None, hardware_spi=None, gpio=None,
+                 spidev=None, drdy=None, use_pigpio=False):
         """
         Initialize MAX31856 device with software SPI on the specified CLK,
         CS, and DO pins.  Alternatively can specify hardware SPI by sending an
-        SPI.SpiDev device in the spi parameter.
+        SPI.SpiDev device in the spi parameter, or the spidev bus and device to use the
+        spidev driver directly.
 
         Args:
             tc_type (1-byte Hex): Type of Thermocouple.  Choose from class variables of the form
@@ -106,36 +360,114 @@ class MAX31856(object):
                 do (integer): Pin number for software SPI MISO
                 di (integer): Pin number for software SPI MOSI
             hardware_spi (SPI.SpiDev): If using hardware SPI, define the connection
+            spidev (tuple): (bus, device) of the spidev device, e.g. (0, 0) for /dev/spidev0.0.
+                Hardware SPI without the Adafruit_GPIO wrapper, for the lowest overhead per read.
+            gpio (Adafruit_GPIO.BaseGPIO): GPIO used for software SPI and the drdy pin, defaults to
+                the platform GPIO
+            drdy (integer): Pin number connected to the board's DRDY (data ready) output, required
+                for read_temp_c_blocking()
+            use_pigpio (bool): Run software SPI on the pigpio daemon's bit bang SPI rather than
+                toggling the pins from Python.  Much faster, but requires pigpio and a running
+                pigpiod, and limits the clock to 250kHz.
         """
         self._logger = logging.getLogger('Adafruit_MAX31856.MAX31856')
         self._spi = None
+        self._temp_c_cache = None
+        self._temp_c_lock = threading.Lock()
         self.tc_type = tc_type
         self.avgsel = avgsel
         # Handle hardware SPI
         if hardware_spi is not None:
             self._logger.debug('Using hardware SPI')
             self._spi = hardware_spi
+        elif spidev is not None:
+            self._logger.debug('Using spidev')
+            self._spi = _SpiDev(spidev[0], spidev[1])
         elif software_spi is not None:
             self._logger.debug('Using software SPI')
-            # Default to platform GPIO if not provided.
-            if gpio is None:
-                gpio = Adafruit_GPIO.get_platform_gpio()
-            self._spi = SPI.BitBang(gpio, software_spi['clk'], software_spi['di'],
-                                                  software_spi['do'], software_spi['cs'])
+            pins = [software_spi.get(pin) for pin in ('clk', 'di', 'do', 'cs')]
+            if None in pins:
+                raise ValueError('software_spi must define clk, cs, do, and di pins!')
+            if use_pigpio:
+                if pigpio is None:
+                    raise ImportError('use_pigpio requires the pigpio module')
+                pi = pigpio.pi()
+                if not pi.connected:
+                    pi.stop()
+                    raise RuntimeError('Could not connect to the pigpio daemon!')
+                self._logger.debug('Using pigpio bit bang SPI')
+                self._spi = _PigpioBitBang(pi, *pins)
+            else:
+                if gpio is None:
+                    gpio = _get_gpio()
+                self._spi = _BitBang(gpio, *pins)
         else:
             raise ValueError(
-                'Must specify either spi for for hardware SPI or clk, cs, and do for softwrare SPI!')
-        self._spi.set_clock_hz(5000000)
+                'Must specify either hardware_spi or spidev for hardware SPI, or software_spi for software SPI!')
+
+        # Data ready pin, driven low by the device when a new conversion result is available
+        self._drdy = drdy
+        if drdy is not None:
+            if gpio is None:
+                gpio = _get_gpio()
+            gpio.setup(drdy, Adafruit_GPIO.IN)
+        self._gpio = gpio
+
+        MAX31856._configure_spi(self._spi)
+
+        # Bind the methods used on every register access once, rather than looking them up per call
+        self._transfer = self._spi.transfer
+        # Register writes don't need the response, use the half-duplex write if available
+        self._write = getattr(self._spi, 'write', self._spi.transfer)
+        self._logger_debug = self._logger.debug
+
+        # Reusable transmit buffers, only the address byte changes between transfers.  Burst read
+        #   buffers are keyed by number of registers read.
+        self._tx2 = bytearray(2)
+        self._tx_bursts = {}
+        self._tx_temp_c = bytearray((self.MAX31856_REG_READ_LTCBH, 0x00, 0x00, 0x00))
+
+        # CR1: averaging mode in bits 6:4, thermocouple type in bits 3:0
+        self.cr1 = ((self.avgsel & 0x07) << 4) | (self.tc_type & 0x0F)
+
+        # Setup for reading continuously with the selected thermocouple type.  The registers keep
+        #   their values while the board is powered, so skip the writes if already configured.
+        cr0, cr1 = self._read_registers(self.MAX31856_REG_READ_CR0, 2)
+        if cr0 != self.MAX31856_CR0_READ_CONT:
+            # CR0 and CR1 are consecutive, so set both in one burst
+            self._write_registers(self.MAX31856_REG_WRITE_CR0,
+                                  (self.MAX31856_CR0_READ_CONT, self.cr1))
+        elif cr1 != self.cr1:
+            self._write_register(self.MAX31856_REG_WRITE_CR1, self.cr1)
+
+    @classmethod
+    def _configure_spi(cls, spi):
+        """
+        Sets the SPI clock, mode and bit order required by the MAX31856.
+
+        Args:
+            spi (SPI.SpiDev, SPI.BitBang): SPI device to configure
+
+        Raises:
+            RuntimeError: If the device supports reading back its mode, and it is not SPI mode 1
+        """
+        # Each setting is an ioctl on Linux spidev, skip them if the underlying spidev device is
+        #   already configured (e.g. opened by _SpiDev, or reused from a previous sensor instance)
+        device = getattr(spi, '_device', None)
+        if (getattr(device, 'max_speed_hz', None) == cls.MAX31856_CONST_SPI_HZ
+                and getattr(device, 'mode', None) == cls.MAX31856_CONST_SPI_MODE
+                and getattr(device, 'lsbfirst', None) is False):
+            return
+
+        spi.set_clock_hz(cls.MAX31856_CONST_SPI_HZ)
         # According to Wikipedia (on SPI) and MAX31856 Datasheet:
         #   SPI mode 1 corresponds with correct timing, CPOL = 0, CPHA = 1
-        self._spi.set_mode(1)
-        self._spi.set_bit_order(SPI.MSBFIRST)
-
-        self.cr1 = ((self.avgsel << 4) + self.tc_type)
+        spi.set_mode(cls.MAX31856_CONST_SPI_MODE)
+        spi.set_bit_order(SPI.MSBFIRST)
 
-        # Setup for reading continuously with T-Type thermocouple
-        self._write_register(self.MAX31856_REG_WRITE_CR0, self.MAX31856_CR0_READ_CONT)
-        self._write_register(self.MAX31856_REG_WRITE_CR1, self.cr1)
+        get_mode = getattr(spi, 'get_mode', None)
+        if get_mode is not None and get_mode() != cls.MAX31856_CONST_SPI_MODE:
+            raise RuntimeError('SPI device did not accept mode {0}!'.format(cls.MAX31856_CONST_SPI_MODE))
 
     @staticmethod
     def _cj_temp_from_bytes(msb, lsb):
@@ -151,19 +483,28 @@ class MAX31856(object):
             lsb (hex): Least significant byte of a CJ temperature
 
         """
-        #            (((msb w/o +/-) shifted by number of 1 byte above lsb)
-        #                                  + val_low_byte)
-        #                                          >> shifted back by # of dead bits
-        temp_bytes = (((msb & 0x7F) << 8) + lsb) >> 2
+        #            ((msb shifted by number of 1 byte above lsb) | val_low_byte)
+        temp_bytes = (msb << 8) | lsb
+        # Sign extend without branching: when the sign bit is set, subtracting it twice removes
+        #   it and applies its negative two's complement weight.
+        temp_bytes -= (temp_bytes & 0x8000) << 1
 
-        if msb & 0x80:
-            # Negative Value.  Scale back by number of bits
-            temp_bytes -= 2**(MAX31856.MAX31856_CONST_CJ_BITS -1)
+        #      (temp_bytes >> shifted back by # of dead bits)*value of lsb
+        return (temp_bytes >> 2)*MAX31856.MAX31856_CONST_CJ_LSB
 
-        #        temp_bytes*value of lsb
-        temp_c = temp_bytes*MAX31856.MAX31856_CONST_CJ_LSB
+    @staticmethod
+    def _cj_temp_from_block(block):
+        """
+        Converts the CJTH, CJTL register block read from the device into a decimal value.
 
-        return temp_c
+        Args:
+            block (bytes): Big-endian CJ temperature registers, msb first
+
+        Returns:
+            temp_c (float): Temperature in degrees celsius
+        """
+        #      ((two's complement register value) >> shifted back by # of dead bits)*value of lsb
+        return (int.from_bytes(block, 'big', signed=True) >> 2)*MAX31856.MAX31856_CONST_CJ_LSB
 
     @staticmethod
     def _thermocouple_temp_from_bytes(byte0, byte1, byte2):
@@ -181,30 +522,76 @@ class MAX31856(object):
         Returns:
             temp_c (float): Temperature in degrees celsius
         """
-        #            (((val_high_byte w/o +/-) shifted by 2 bytes above LSB)
-        #                 + (val_mid_byte shifted by number 1 byte above LSB)
-        #                                             + val_low_byte )
-        #                              >> back shift by number of dead bits
-        temp_bytes = (((byte2 & 0x7F) << 16) + (byte1 << 8) + byte0)
-        temp_bytes = temp_bytes >> 5
+        #            ((val_high_byte shifted by 2 bytes above LSB)
+        #                 | (val_mid_byte shifted by number 1 byte above LSB) | val_low_byte)
+        temp_bytes = (byte2 << 16) | (byte1 << 8) | byte0
+        # Sign extend without branching, see _cj_temp_from_bytes()
+        temp_bytes -= (temp_bytes & 0x800000) << 1
 
-        if byte2 & 0x80:
-            temp_bytes -= 2**(MAX31856.MAX31856_CONST_THERM_BITS -1)
+        #      (temp_bytes >> back shift by # of dead bits)*value of LSB
+        return (temp_bytes >> 5)*MAX31856.MAX31856_CONST_THERM_LSB
 
-        #        temp_bytes*value of LSB
-        temp_c = temp_bytes*MAX31856.MAX31856_CONST_THERM_LSB
+    @staticmethod
+    def _thermocouple_temp_from_block(block):
+        """
+        Converts the LTCBH, LTCBM, LTCBL register block read from the device into a decimal value.
 
-        return temp_c
+        Args:
+            block (bytes): Big-endian thermocouple temperature registers, most significant first
+
+        Returns:
+            temp_c (float): Temperature in degrees celsius
+        """
+        #      ((two's complement register value) >> back shift by # of dead bits)*value of LSB
+        return (int.from_bytes(block, 'big', signed=True) >> 5)*MAX31856.MAX31856_CONST_THERM_LSB
+
+    @staticmethod
+    def decode_therm_batch(raw_bytes):
+        """
+        Converts a buffer of raw thermocouple register samples to temperatures in one pass.
+
+        Requires numpy, see Adafruit_MAX31856.decode.decode_therm_batch().
+
+        Args:
+            raw_bytes (bytes): 3*N bytes of LTCBH, LTCBM, LTCBL samples
+
+        Returns:
+            (numpy.ndarray): N float32 temperatures in degrees celsius
+        """
+        from .decode import decode_therm_batch
+        return decode_therm_batch(raw_bytes)
+
+    def read_temperatures(self):
+        """
+        Return the thermocouple and cold junction temperatures, along with the fault status.
+
+        All values are read in a single burst from the CJTH register through the FAULT
+        register, which is faster than calling read_temp_c(), read_internal_temp_c() and
+        read_fault_register() one after the other.
+
+        Returns:
+            (Reading): Named tuple of thermocouple temperature (deg. C), cold junction
+                temperature (deg. C) and fault register value
+        """
+        raw = self._read_registers(self.MAX31856_REG_READ_CJTH, 6)
+
+        cj_temp_c = MAX31856._cj_temp_from_block(raw[0:2])
+        temp_c = MAX31856._thermocouple_temp_from_block(raw[2:5])
+        fault = raw[5]
+
+        self._logger_debug("Cold Junction Temperature %s deg. C", cj_temp_c)
+        self._logger_debug("Thermocouple Temperature %s deg. C", temp_c)
+
+        return Reading(temp_c, cj_temp_c, fault)
 
     def read_internal_temp_c(self):
         """
         Return internal temperature value in degrees celsius.
         """
-        val_low_byte = self._read_register(self.MAX31856_REG_READ_CJTL)
-        val_high_byte = self._read_register(self.MAX31856_REG_READ_CJTH)
+        raw = self._read_registers(self.MAX31856_REG_READ_CJTH, 2)
 
-        temp_c = MAX31856._cj_temp_from_bytes(val_high_byte, val_low_byte)
-        self._logger.debug("Cold Junction Temperature {0} deg. C".format(temp_c))
+        temp_c = MAX31856._cj_temp_from_block(raw)
+        self._logger_debug("Cold Junction Temperature %s deg. C", temp_c)
 
         return temp_c
 
@@ -212,23 +599,163 @@ class MAX31856(object):
         """
         Return the thermocouple temperature value in degrees celsius.
         """
-        val_low_byte = self._read_register(self.MAX31856_REG_READ_LTCBL)
-        val_mid_byte = self._read_register(self.MAX31856_REG_READ_LTCBM)
-        val_high_byte = self._read_register(self.MAX31856_REG_READ_LTCBH)
+        # Thermocouple reads are the hot path, so use a dedicated transmit buffer and bypass the
+        #   general _read_registers()
+        raw = self._transfer(self._tx_temp_c)
+        if raw is None or len(raw) != 4:
+            raise RuntimeError(_SHORT_READ_ERROR)
 
-        temp_c = MAX31856._thermocouple_temp_from_bytes(val_low_byte, val_mid_byte, val_high_byte)
+        # LTCBH..LTCBL, masking off the byte received while sending the address rather than
+        #   slicing it off, then sign extended and shifted back by the dead bits
+        value = int.from_bytes(raw, 'big') & 0xFFFFFF
+        temp_c = ((value - ((value & 0x800000) << 1)) >> 5)*self.MAX31856_CONST_THERM_LSB
 
-        self._logger.debug("Thermocouple Temperature {0} deg. C".format(temp_c))
+        self._logger_debug("Thermocouple Temperature %s deg. C", temp_c)
 
         return temp_c
 
+    def read_temp_c_blocking(self, timeout=None):
+        """
+        Return the next thermocouple temperature value in degrees celsius, sleeping until the
+        device signals that the conversion is ready on the DRDY pin.
+
+        If a conversion is already waiting to be read (DRDY low) it is read immediately.  Requires
+        the drdy pin to be given to __init__.
+
+        Args:
+            timeout (float): Seconds to wait for DRDY, see wait_for_drdy()
+        """
+        self.wait_for_drdy(timeout)
+
+        return self.read_temp_c()
+
+    def wait_for_drdy(self, timeout=None):
+        """
+        Sleep until the device signals a new conversion on the DRDY pin, returning immediately if
+        one is already waiting to be read (DRDY low).  Requires the drdy pin to be given to
+        __init__.
+
+        DRDY stays low until the thermocouple registers are read, so the pin level is polled
+        rather than waiting for a falling edge, which is missed if it happens before the wait
+        starts.
+
+        Args:
+            timeout (float): Seconds to wait, defaults to twice the conversion time for the
+                configured averaging
+
+        Raises:
+            RuntimeError: If DRDY does not go low before the timeout, e.g. when it is not connected
+        """
+        if self._drdy is None:
+            raise RuntimeError('wait_for_drdy() requires the drdy pin to be specified!')
+
+        if timeout is None:
+            # AVGSEL 0-4 average 1, 2, 4, 8 or 16 samples, larger values also average 16
+            samples = 1 << min(self.avgsel & 0x07, 4)
+            timeout = 2*(self.MAX31856_CONST_CONV_S + (samples - 1)*self.MAX31856_CONST_AVG_CONV_S)
+
+        is_high = self._gpio.is_high
+        deadline = time.monotonic() + timeout
+        while is_high(self._drdy):
+            if time.monotonic() > deadline:
+                raise RuntimeError('DRDY did not signal a conversion within {0}s!'.format(timeout))
+            time.sleep(self.MAX31856_CONST_DRDY_POLL_S)
+
+    def read_temp_q7(self):
+        """
+        Return the thermocouple temperature as a fixed point integer, in units of 1/128 deg. C.
+
+        This is the register value without the conversion to float, divide by 128.0 (or compare
+        with is_over()) only where degrees are needed.
+        """
+        raw = self._read_registers(self.MAX31856_REG_READ_LTCBH, 3)
+
+        return int.from_bytes(raw, 'big', signed=True) >> 5
+
+    @staticmethod
+    def is_over(raw_q7, limit_c):
+        """
+        Check a read_temp_q7() reading against a temperature limit without converting the reading.
+
+        Args:
+            raw_q7 (integer): Thermocouple temperature from read_temp_q7()
+            limit_c (float): Limit in degrees celsius
+
+        Returns:
+            (bool): True if the reading is above the limit
+        """
+        return raw_q7 > limit_c*128
+
+    async def read_temp_c_async(self):
+        """
+        Coroutine returning the thermocouple temperature value in degrees celsius.
+
+        The SPI transfer is run in the event loop's default executor, so other tasks can run
+        while it completes.  In continuous conversion mode the sensor only updates approx. every
+        100ms, so a reading taken less than MAX31856_CONST_CONT_CACHE_S seconds ago is returned
+        again instead of reading the device.
+        """
+        cache = self._temp_c_cache
+        if cache is not None and time.monotonic() - cache[0] < self.MAX31856_CONST_CONT_CACHE_S:
+            return cache[1]
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._read_temp_c_cached)
+
+    def _read_temp_c_cached(self):
+        """
+        Return the cached thermocouple temperature, reading the device if it has expired.
+
+        Concurrent read_temp_c_async() calls run this in separate executor threads, the lock makes
+        all but the first reuse the first one's reading.
+        """
+        with self._temp_c_lock:
+            now = time.monotonic()
+            cache = self._temp_c_cache
+            if cache is None or now - cache[0] >= self.MAX31856_CONST_CONT_CACHE_S:
+                cache = self._temp_c_cache = (now, self.read_temp_c())
+            return cache[1]
+
+    async def stream(self, interval):
+        """
+        Asynchronous generator yielding a thermocouple temperature reading every interval seconds.
+
+        Args:
+            interval (float): Seconds to wait between readings
+        """
+        while True:
+            yield await self.read_temp_c_async()
+            await asyncio.sleep(interval)
+
     def read_fault_register(self):
-        """Return bytes containing fault codes and hardware problems.
+        """Return the Fault Status Register value, containing fault codes and hardware problems.
+
+        Non-zero when a fault is present, the bits are listed in MAX31856_FAULT_BITS.  See
+        read_faults() for the decoded faults.
+        """
+        return self._read_register(self.MAX31856_REG_READ_FAULT)
+
+    def read_faults(self):
+        """Return the fault codes and hardware problems reported by the device, decoded.
+
+        Returns:
+            (FaultFlags): Named tuple of bools, True if the fault is present.  False when no fault
+                is present.
+        """
+        return MAX31856._faults_from_byte(self.read_fault_register())
 
-        TODO: Could update in the future to return human readable values
+    @staticmethod
+    def _faults_from_byte(reg):
+        """
+        Decodes the Fault Status Register value into named faults.
+
+        Args:
+            reg (hex): Fault Status Register value
+
+        Returns:
+            (FaultFlags): Named tuple of bools, see MAX31856_FAULT_BITS
         """
-        reg = self._read_register(self.MAX31856_REG_READ_FAULT)
-        return reg
+        return FaultFlags._make(bool(reg & mask) for _, mask in MAX31856.MAX31856_FAULT_BITS)
 
     def _read_register(self, address):
         """
@@ -245,15 +772,61 @@ class MAX31856(object):
             value.  The first returned byte is discarded because no data is transmitted while
             specifying the register address.
         """
-        raw = self._spi.transfer([address, 0x00])
-        if raw is None or len(raw) != 2:
-            raise RuntimeError('Did not read expected number of bytes from device!')
-
-        value = raw[1]
-        self._logger.debug('Read Register: 0x{0:02X}, Raw Value: 0x{1:02X}'.format(
-            (address & 0xFFFF), (value & 0xFFFF)))
+        tx_buf = self._tx2
+        tx_buf[0] = address
+        tx_buf[1] = 0x00
+        raw = self._transfer(tx_buf)
+        try:
+            value = raw[1]
+        except (TypeError, IndexError):
+            raise RuntimeError(_SHORT_READ_ERROR) from None
+
+        self._logger_debug('Read Register: 0x%02X, Raw Value: 0x%02X',
+                           (address & 0xFF), (value & 0xFF))
         return value
 
+    def _read_registers(self, address, count):
+        """
+        Reads count consecutive registers from the MAX31856, starting at address.
+
+        Args:
+            address (8-bit Hex): Address of the first register to read.  Format 0Xh. Constants
+                listed in class as MAX31856_REG_READ_*
+            count (integer): Number of registers to read
+
+        Returns:
+            (list): Register values, in address order
+
+        Note:
+            The MAX31856 auto-increments the register address while CS is held low, so a single
+            SPI transfer of the address followed by count dummy bytes reads all of the registers.
+            As in _read_register(), the first returned byte is discarded.
+        """
+        tx_buf = self._tx_bursts.get(count)
+        if tx_buf is None:
+            tx_buf = self._tx_bursts[count] = bytearray(count + 1)
+        tx_buf[0] = address
+        raw = self._transfer(tx_buf)
+        if raw is None or len(raw) != count + 1:
+            raise RuntimeError(_SHORT_READ_ERROR)
+
+        values = raw[1:]
+        # Only build the list of values when it will be logged
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger_debug('Read Registers: 0x%02X-0x%02X, Raw Values: %s',
+                               (address & 0xFF), ((address + count - 1) & 0xFF),
+                               ' '.join('0x{0:02X}'.format(value & 0xFF) for value in values))
+        return values
+
+    def _dump_registers(self):
+        """
+        Reads all 16 registers (0x00-0x0F) from the MAX31856 in a single burst, for debugging.
+
+        Returns:
+            (list): Register values, indexed by read address
+        """
+        return self._read_registers(self.MAX31856_REG_READ_CR0, 16)
+
     def _write_register(self, address, write_value):
         """
         Writes to a register at address from the MAX31856
@@ -262,23 +835,92 @@ class MAX31856(object):
             address (8-bit Hex): Address for read register.  Format 0Xh. Constants listed in class
                 as MAX31856_REG_WRITE_*
             write_value (8-bit Hex): Value to write to the register
+
+        Note:
+            Uses the half-duplex SPI write when the device has one, nothing is read back.  Errors
+            are raised as exceptions by the SPI device.
+        """
+        tx_buf = self._tx2
+        tx_buf[0] = address
+        tx_buf[1] = write_value
+        self._write(tx_buf)
+        self._logger_debug('Wrote Register: 0x%02X, Value 0x%02X', (address & 0xFF),
+                           (write_value & 0xFF))
+
+    def _write_registers(self, address, write_values):
         """
-        self._spi.transfer([address, write_value])
-        self._logger.debug('Wrote Register: 0x{0:02X}, Value 0x{1:02X}'.format((address & 0xFF),
-                                                                            (write_value & 0xFF)))
+        Writes consecutive registers on the MAX31856, starting at address.
 
-        # If we've gotten this far without an exception, the transmission must've gone through
-        return True
+        Args:
+            address (8-bit Hex): Address of the first register to write.  Format 0Xh. Constants
+                listed in class as MAX31856_REG_WRITE_*
+            write_values (sequence of 8-bit Hex): Values to write, in address order
+
+        Note:
+            As with burst reads, the MAX31856 auto-increments the register address while CS is held
+            low, so all of the values are written in a single SPI transfer.
+        """
+        tx_buf = bytearray(len(write_values) + 1)
+        tx_buf[0] = address
+        tx_buf[1:] = bytes(write_values)
+        self._write(tx_buf)
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger_debug('Wrote Registers: 0x%02X-0x%02X, Values %s', (address & 0xFF),
+                               ((address + len(write_values) - 1) & 0xFF),
+                               ' '.join('0x{0:02X}'.format(value & 0xFF) for value in write_values))
 
     # Deprecated Methods
     def readTempC(self):    #pylint: disable-msg=invalid-name
         """Depreciated due to Python naming convention, use read_temp_c instead
         """
         warnings.warn("Depreciated due to Python naming convention, use read_temp_c() instead", DeprecationWarning)
-        return read_temp_c(self)
+        return self.read_temp_c()
 
     def readInternalTempC(self):    #pylint: disable-msg=invalid-name
         """Depreciated due to Python naming convention, use read_internal_temp_c instead
         """
         warnings.warn("Depreciated due to Python naming convention, use read_internal_temp_c() instead", DeprecationWarning)
-        return read_internal_temp_c(self)
+        return self.read_internal_temp_c()
+
+
+class FaultFlags(collections.namedtuple('FaultFlags',
+                                        [name for name, _ in MAX31856.MAX31856_FAULT_BITS])):
+    """Result of MAX31856.read_faults(), True for each fault present.
+
+    Fields are named and ordered by MAX31856.MAX31856_FAULT_BITS.  Like the raw register value, it
+    is only true when a fault is present.
+    """
+    __slots__ = ()
+
+    def __bool__(self):
+        return any(self)
+
+
+def read_many(sensors):
+    """
+    Return the temperatures and fault status of several sensors, e.g. boards sharing an SPI bus on
+    separate CS lines.
+
+    Each sensor is read with the same single burst as MAX31856.read_temperatures(), but the
+    transmit buffer and method lookups are set up once for all of them.
+
+    Args:
+        sensors (list): MAX31856 instances to read
+
+    Returns:
+        (list): Reading for each sensor, in the same order
+    """
+    tx_buf = bytearray(7)
+    tx_buf[0] = MAX31856.MAX31856_REG_READ_CJTH
+    cj_temp_from_block = MAX31856._cj_temp_from_block # pylint: disable-msg=protected-access
+    thermocouple_temp_from_block = MAX31856._thermocouple_temp_from_block # pylint: disable-msg=protected-access
+
+    readings = []
+    append = readings.append
+    for sensor in sensors:
+        raw = sensor._transfer(tx_buf) # pylint: disable-msg=protected-access
+        if raw is None or len(raw) != 7:
+            raise RuntimeError(_SHORT_READ_ERROR)
+        append(Reading(thermocouple_temp_from_block(raw[3:6]), cj_temp_from_block(raw[1:3]), raw[6]))
+
+    return readings
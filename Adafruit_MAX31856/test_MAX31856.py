@@ -22,13 +22,26 @@ THE SOFTWARE.
 """
 
 # Global Imports
+import asyncio
 import logging
+import time
 import unittest
-import RPi.GPIO as GPIO
 import Adafruit_GPIO.SPI as SPI
+try:
+    import RPi.GPIO as GPIO
+except (ImportError, RuntimeError):
+    # Not a Raspberry Pi, only the tests using simulated devices can run
+    GPIO = None
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 # Local Imports
-from max31856 import MAX31856 as MAX31856
+from Adafruit_MAX31856 import decode
+from Adafruit_MAX31856.max31856 import MAX31856 as MAX31856
+from Adafruit_MAX31856.max31856 import read_many
+from Adafruit_MAX31856.max31856 import _BitBang
 
 logging.basicConfig(
     filename='test_MAX31856.log',
@@ -36,10 +49,143 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 _logger = logging.getLogger(__name__)
 
+# Datasheet temperature register values, (LTCBH, LTCBM, LTCBL, deg. C) and (CJTH, CJTL, deg. C)
+_THERMOCOUPLE_VECTORS = (
+    (0x01, 0x70, 0x20, 23.0078125),
+    (0b00000001, 0b10010000, 0b00000000, 25.0),
+    (0b00000000, 0b00000000, 0b00000000, 0.0),
+    (0b11111111, 0b11110000, 0b00000000, -1.0),
+    (0b11110000, 0b01100000, 0b00000000, -250.0),
+)
+_CJ_VECTORS = (
+    (0x1C, 0x64, 28.390625),
+    (0b01111111, 0b11111100, 127.984375),
+    (0b00011001, 0b00000000, 25),
+    (0b00000000, 0b00000000, 0),
+    (0b11100111, 0b00000000, -25),
+    (0b11001001, 0b00000000, -55),
+)
+
+
+class _FakeSpi(object):
+    """
+    Simulated MAX31856 on an SPI device, for testing the register handling without the board.
+
+    Register addresses auto-increment as on the device, and the byte received while sending the
+    address is not zero, so it must be discarded by the caller.  Each transfer takes delay seconds.
+    """
+
+    def __init__(self, registers=None):
+        self.registers = bytearray(16)
+        for address, value in (registers or {}).items():
+            self.registers[address] = value
+        self.transfers = []
+        self.delay = 0
+
+    def set_clock_hz(self, hz):
+        pass
+
+    def set_mode(self, mode):
+        pass
+
+    def set_bit_order(self, order):
+        pass
+
+    def transfer(self, data):
+        self.transfers.append(bytes(data))
+        time.sleep(self.delay)
+        address = data[0]
+        result = bytearray(len(data))
+        result[0] = 0xA5
+        for ii, value in enumerate(data[1:]):
+            register = ((address & 0x7F) + ii) & 0x0F
+            if address & 0x80:
+                self.registers[register] = value
+            else:
+                result[ii + 1] = self.registers[register]
+        return result
+
+
+class _FakeGpio(object):
+    """
+    Simulated GPIO, inputs (e.g. the DRDY pin) read high until drdy_low is set.
+    """
+
+    def __init__(self):
+        self.drdy_low = False
+
+    def setup(self, pin, mode):
+        pass
+
+    def output(self, pin, value):
+        pass
+
+    def set_high(self, pin):
+        pass
+
+    def set_low(self, pin):
+        pass
+
+    def is_high(self, pin):
+        return not self.drdy_low
+
+
+class _RecordingGpio(object):
+    """
+    Simulated GPIO recording every pin level set and read, in order.  The MISO pin reads back the
+    bits of response, most significant bit first.
+    """
+
+    def __init__(self, miso, response):
+        self.events = []
+        self._miso = miso
+        self._bits = [bool(byte & (0x80 >> ii)) for byte in response for ii in range(8)]
+
+    def setup(self, pin, mode, pull_up_down=None):
+        pass
+
+    def output(self, pin, value):
+        self.events.append((pin, bool(value)))
+
+    def set_high(self, pin):
+        self.output(pin, True)
+
+    def set_low(self, pin):
+        self.output(pin, False)
+
+    def is_high(self, pin):
+        self.events.append((pin, 'read'))
+        return self._bits.pop(0) if pin == self._miso else False
+
+
 class Adafruit_MAX31856(unittest.TestCase):
-    
+    """
+    Tests requiring the board connected on hardware SPI, skipped when the SPI device is unavailable.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Opens the hardware SPI device once, shared by all of the tests.
+        """
+        # Raspberry Pi hardware SPI configuration.
+        spi_port = 0
+        spi_device = 0
+        try:
+            cls.spi = SPI.SpiDev(spi_port, spi_device)
+        except (ImportError, OSError) as err:
+            raise unittest.SkipTest('Hardware SPI device unavailable: {0}'.format(err))
+
+    def setUp(self):
+        """
+        Initializes the default (T type) sensor for each test, which also restores its
+        configuration on the device after a test using a differently configured sensor.
+        """
+        self.sensor = MAX31856(hardware_spi=self.spi)
+
     def tearDown(self):
-        GPIO.cleanup()
+        if GPIO is not None:
+            GPIO.cleanup()
 
     #def test_software_spi_initialize(self):
         #"""Checks to see if the sensor can initialize on the software SPI interface.
@@ -77,21 +223,38 @@ class Adafruit_MAX31856(unittest.TestCase):
         else:
             self.assertTrue(False)
 
+    def test_spidev_initialize(self):
+        """
+        Checks to see if the sensor can initialize directly on the spidev driver.
+
+        Will fail if it cannot find the MAX31856 library or the spidev module.  Test only checks to
+        see that the sensor can be initialized in Software, does not check the hardware connection.
+        """
+        _logger.debug('test_spidev_initialize()')
+        # Raspberry Pi hardware SPI configuration.
+        spi_port = 0
+        spi_device = 0
+        sensor = MAX31856(spidev=(spi_port, spi_device))
+
+        if sensor:
+            self.assertTrue(True)
+        else:
+            self.assertTrue(False)
+
     def test_get_register_reading(self):
         """
         Checks to see if we can read a register from the device.  Good test for correct
         connectivity.
         """
         _logger.debug('test_get_register_reading()')
-        # Raspberry Pi hardware SPI configuration.
-        spi_port = 0
-        spi_device = 0
-        sensor = MAX31856(hardware_spi=SPI.SpiDev(spi_port, spi_device))
+        sensor = self.sensor
 
-        value = sensor._read_register(MAX31856.MAX31856_REG_READ_CR0)
-        for ii in range(0x00, 0x10):
-            # Read all of the registers, will store data to log
-            sensor._read_register(ii) # pylint: disable-msg=protected-access
+        # Read all of the registers in one burst, will store data to log
+        registers = sensor._dump_registers() # pylint: disable-msg=protected-access
+        for ii, register in enumerate(registers):
+            _logger.debug('Register 0x%02X: 0x%02X', ii, register)
+
+        value = registers[MAX31856.MAX31856_REG_READ_CR0]
 
         if value:
             self.assertTrue(True)
@@ -118,10 +281,7 @@ class Adafruit_MAX31856(unittest.TestCase):
         Checks to see if we can read a temperature from the board, using Hardware SPI
         """
         _logger.debug('test_get_temperaure_reading')
-        # Raspberry Pi hardware SPI configuration.
-        spi_port = 0
-        spi_device = 0
-        sensor = MAX31856(hardware_spi=SPI.SpiDev(spi_port, spi_device))
+        sensor = self.sensor
 
         temp = sensor.read_temp_c()
 
@@ -135,10 +295,7 @@ class Adafruit_MAX31856(unittest.TestCase):
         Checks to see if we can read a temperature from the board, using Hardware SPI
         """
         _logger.debug('test_get_internal_temperature_reading()')
-        # Raspberry Pi hardware SPI configuration.
-        spi_port = 0
-        spi_device = 0
-        sensor = MAX31856(hardware_spi=SPI.SpiDev(spi_port, spi_device))
+        sensor = self.sensor
 
         temp = sensor.read_internal_temp_c()
 
@@ -152,10 +309,7 @@ class Adafruit_MAX31856(unittest.TestCase):
         Checks to see if we can read a temperature from the board, using Hardware SPI, and K type thermocouple
         """
         _logger.debug('test_get_internal_temperature_reading()')
-        # Raspberry Pi hardware SPI configuration.
-        spi_port = 0
-        spi_device = 0
-        sensor = MAX31856(hardware_spi=SPI.SpiDev(spi_port, spi_device), tc_type=MAX31856.MAX31856_K_TYPE)
+        sensor = MAX31856(hardware_spi=self.spi, tc_type=MAX31856.MAX31856_K_TYPE)
 
         temp = sensor.read_internal_temp_c()
 
@@ -164,6 +318,115 @@ class Adafruit_MAX31856(unittest.TestCase):
         else:
             self.assertTrue(False)
 
+    def test_get_temperatures_reading(self):
+        """
+        Checks to see if we can read both temperatures and the fault register from the board in one
+        burst, using Hardware SPI
+        """
+        _logger.debug('test_get_temperatures_reading()')
+        sensor = self.sensor
+
+        reading = sensor.read_temperatures()
+
+        if reading.thermocouple and reading.cold_junction:
+            self.assertTrue(True)
+        else:
+            self.assertTrue(False)
+
+    def test_get_many_temperatures_reading(self):
+        """
+        Checks to see if we can read a list of sensors in one batch, using Hardware SPI
+        """
+        _logger.debug('test_get_many_temperatures_reading()')
+        sensor = self.sensor
+
+        readings = read_many([sensor, sensor])
+
+        self.assertEqual(len(readings), 2)
+        if readings[0].thermocouple and readings[0].cold_junction:
+            self.assertTrue(True)
+        else:
+            self.assertTrue(False)
+
+    def test_get_temperaure_reading_async(self):
+        """
+        Checks to see if we can read a temperature from the board from an event loop, using
+        Hardware SPI
+        """
+        _logger.debug('test_get_temperaure_reading_async()')
+        sensor = self.sensor
+
+        temp = asyncio.run(sensor.read_temp_c_async())
+
+        if temp:
+            self.assertTrue(True)
+        else:
+            self.assertTrue(False)
+
+
+class Adafruit_MAX31856_Simulated(unittest.TestCase):
+    """
+    Tests of the conversions, and of the driver on simulated SPI and GPIO devices, which run
+    without the board.
+    """
+
+    def test_software_spi_transfer(self):
+        """
+        Checks the software SPI transfer against Adafruit_GPIO's BitBang, comparing the bytes read
+        and every pin change, in each SPI mode and bit order.
+        """
+        _logger.debug('test_software_spi_transfer()')
+        data = bytes((0x0C, 0x00, 0xA5, 0x3C))
+        response = bytes((0x00, 0x81, 0x5A, 0xFF))
+        pins = (25, 10, 9, 8) # clk, di, do, cs
+
+        for mode in range(4):
+            for order in (SPI.MSBFIRST, SPI.LSBFIRST):
+                reference_gpio = _RecordingGpio(9, response)
+                reference = SPI.BitBang(reference_gpio, *pins)
+                reference.set_mode(mode)
+                reference.set_bit_order(order)
+
+                gpio = _RecordingGpio(9, response)
+                bitbang = _BitBang(gpio, *pins)
+                bitbang.set_mode(mode)
+                bitbang.set_bit_order(order)
+
+                self.assertEqual(bitbang.transfer(data), reference.transfer(data))
+                self.assertEqual(gpio.events, reference_gpio.events)
+
+    def test_concurrent_async_reads(self):
+        """
+        Checks that concurrent async reads of one sensor share a single read of the device.
+        """
+        _logger.debug('test_concurrent_async_reads()')
+        spi = _FakeSpi()
+        sensor = MAX31856(hardware_spi=spi)
+        del spi.transfers[:]
+        spi.delay = 0.01
+
+        async def read_concurrently():
+            return await asyncio.gather(*[sensor.read_temp_c_async() for _ in range(4)])
+
+        asyncio.run(read_concurrently())
+        self.assertEqual(len(spi.transfers), 1)
+
+    def test_software_spi_shared_bus_lock(self):
+        """
+        Checks that software SPI sensors sharing a clock pin of a GPIO serialize transfers on one
+        lock, and sensors on another clock pin or GPIO don't.
+        """
+        _logger.debug('test_software_spi_shared_bus_lock()')
+        gpio = _FakeGpio()
+        sensor_1 = MAX31856(software_spi={"clk": 25, "cs": 8, "do": 9, "di": 10}, gpio=gpio)
+        sensor_2 = MAX31856(software_spi={"clk": 25, "cs": 7, "do": 9, "di": 10}, gpio=gpio)
+        sensor_3 = MAX31856(software_spi={"clk": 11, "cs": 6, "do": 9, "di": 10}, gpio=gpio)
+        sensor_4 = MAX31856(software_spi={"clk": 25, "cs": 8, "do": 9, "di": 10}, gpio=_FakeGpio())
+
+        self.assertIs(sensor_1._spi._lock, sensor_2._spi._lock) # pylint: disable-msg=protected-access
+        self.assertIsNot(sensor_1._spi._lock, sensor_3._spi._lock) # pylint: disable-msg=protected-access
+        self.assertIsNot(sensor_1._spi._lock, sensor_4._spi._lock) # pylint: disable-msg=protected-access
+
     def test_temperature_byte_conversions(self):
         """
         Checks the byte conversion for various known temperature byte values.
@@ -236,6 +499,162 @@ class Adafruit_MAX31856(unittest.TestCase):
         decimal_cj_temp = MAX31856._cj_temp_from_bytes(msb, lsb) # pylint: disable-msg=protected-access
         self.assertEqual(decimal_cj_temp, -55)
 
+    def test_temperature_block_conversions(self):
+        """
+        Checks the register block conversion used by the burst reads for known temperature values.
+        """
+        _logger.debug('test_temperature_block_conversions()')
+
+        for byte2, byte1, byte0, temp in _THERMOCOUPLE_VECTORS:
+            decimal_temp = MAX31856._thermocouple_temp_from_block(bytes((byte2, byte1, byte0))) # pylint: disable-msg=protected-access
+            self.assertEqual(decimal_temp, temp)
+
+        for msb, lsb, temp in _CJ_VECTORS:
+            decimal_cj_temp = MAX31856._cj_temp_from_block(bytes((msb, lsb))) # pylint: disable-msg=protected-access
+            self.assertEqual(decimal_cj_temp, temp)
+
+    def test_decode_conversions(self):
+        """
+        Checks the offline decoders against the driver's conversions for known temperature values.
+        """
+        _logger.debug('test_decode_conversions()')
+
+        for byte2, byte1, byte0, temp in _THERMOCOUPLE_VECTORS:
+            decimal_temp = decode.decode_therm(byte2, byte1, byte0)
+            self.assertEqual(decimal_temp, temp)
+            self.assertEqual(decimal_temp, MAX31856._thermocouple_temp_from_bytes(byte0, byte1, byte2)) # pylint: disable-msg=protected-access
+
+        for msb, lsb, temp in _CJ_VECTORS:
+            decimal_cj_temp = decode.decode_cj(msb, lsb)
+            self.assertEqual(decimal_cj_temp, temp)
+            self.assertEqual(decimal_cj_temp, MAX31856._cj_temp_from_bytes(msb, lsb)) # pylint: disable-msg=protected-access
+
+    @unittest.skipIf(numpy is None, 'requires numpy')
+    def test_decode_arrays(self):
+        """
+        Checks the offline array and buffer decoders for known temperature values.
+        """
+        _logger.debug('test_decode_arrays()')
+        raw_bytes = bytes(value for vector in _THERMOCOUPLE_VECTORS for value in vector[:3])
+        temps = [vector[3] for vector in _THERMOCOUPLE_VECTORS]
+
+        samples = numpy.frombuffer(raw_bytes, dtype=numpy.uint8).reshape(-1, 3)
+        decimal_temps = decode.decode_therm_arr(samples[:, 0], samples[:, 1], samples[:, 2])
+        self.assertIsInstance(decimal_temps, numpy.ndarray)
+        self.assertEqual(decimal_temps.tolist(), temps)
+
+        decimal_temps = decode.decode_therm_batch(raw_bytes)
+        self.assertIsInstance(decimal_temps, numpy.ndarray)
+        self.assertEqual(decimal_temps.dtype, numpy.float32)
+        self.assertEqual(decimal_temps.tolist(), temps)
+
+        with self.assertRaises(ValueError):
+            decode.decode_therm_batch(raw_bytes[:-1])
+
+    @unittest.skipIf(numpy is None, 'requires numpy')
+    def test_decode_therm_batch(self):
+        """
+        Checks the driver's batch decoder for known temperature values.
+        """
+        _logger.debug('test_decode_therm_batch()')
+        raw_bytes = bytes(value for vector in _THERMOCOUPLE_VECTORS for value in vector[:3])
+
+        decimal_temps = MAX31856.decode_therm_batch(raw_bytes)
+        self.assertEqual(decimal_temps.tolist(), [vector[3] for vector in _THERMOCOUPLE_VECTORS])
+
+    def test_temperature_reads(self):
+        """
+        Checks each temperature read method decodes known register values, discarding the byte
+        received while sending the address.
+        """
+        _logger.debug('test_temperature_reads()')
+        spi = _FakeSpi()
+        sensor = MAX31856(hardware_spi=spi)
+        registers = spi.registers
+
+        for byte2, byte1, byte0, temp in _THERMOCOUPLE_VECTORS:
+            registers[MAX31856.MAX31856_REG_READ_LTCBH:MAX31856.MAX31856_REG_READ_LTCBL + 1] = \
+                bytes((byte2, byte1, byte0))
+            self.assertEqual(sensor.read_temp_c(), temp)
+            self.assertEqual(sensor.read_temp_q7(), temp*128)
+            self.assertEqual(sensor.read_temperatures().thermocouple, temp)
+            self.assertEqual(read_many([sensor])[0].thermocouple, temp)
+
+        for msb, lsb, temp in _CJ_VECTORS:
+            registers[MAX31856.MAX31856_REG_READ_CJTH:MAX31856.MAX31856_REG_READ_CJTL + 1] = \
+                bytes((msb, lsb))
+            self.assertEqual(sensor.read_internal_temp_c(), temp)
+            self.assertEqual(sensor.read_temperatures().cold_junction, temp)
+            self.assertEqual(read_many([sensor])[0].cold_junction, temp)
+
+        registers[MAX31856.MAX31856_REG_READ_FAULT] = 0x01
+        self.assertEqual(sensor.read_temperatures().fault, 0x01)
+        self.assertEqual(read_many([sensor])[0].fault, 0x01)
+
+    def test_fault_register_decoding(self):
+        """
+        Checks the decoding of known Fault Status Register values.
+        """
+        _logger.debug('test_fault_register_decoding()')
+
+        faults = MAX31856._faults_from_byte(0x00) # pylint: disable-msg=protected-access
+        self.assertFalse(any(faults))
+        self.assertFalse(faults)
+
+        faults = MAX31856._faults_from_byte(0x01) # pylint: disable-msg=protected-access
+        self.assertTrue(faults.open_circuit)
+        self.assertEqual(sum(faults), 1)
+        self.assertTrue(faults)
+
+        faults = MAX31856._faults_from_byte(0xC2) # pylint: disable-msg=protected-access
+        self.assertTrue(faults.cj_out_of_range)
+        self.assertTrue(faults.tc_out_of_range)
+        self.assertTrue(faults.over_under_voltage)
+        self.assertEqual(sum(faults), 3)
+
+    def test_read_fault_register(self):
+        """
+        Checks that the fault register is returned as the raw value, and decoded by read_faults().
+        """
+        _logger.debug('test_read_fault_register()')
+        spi = _FakeSpi()
+        sensor = MAX31856(hardware_spi=spi)
+
+        self.assertEqual(sensor.read_fault_register(), 0)
+        self.assertFalse(sensor.read_faults())
+
+        spi.registers[MAX31856.MAX31856_REG_READ_FAULT] = 0x01
+        self.assertEqual(sensor.read_fault_register(), 0x01)
+        self.assertTrue(sensor.read_faults().open_circuit)
+
+    def test_read_temp_c_override(self):
+        """
+        Checks that read_temp_c() is a method of the class, which subclasses can override.
+        """
+        _logger.debug('test_read_temp_c_override()')
+
+        class _Override(MAX31856):
+            __slots__ = ()
+
+            def read_temp_c(self):
+                return 'override'
+
+        self.assertEqual(_Override(hardware_spi=_FakeSpi()).read_temp_c(), 'override')
+
+    def test_wait_for_drdy(self):
+        """
+        Checks that wait_for_drdy() returns once DRDY is low, and times out if it never goes low.
+        """
+        _logger.debug('test_wait_for_drdy()')
+        gpio = _FakeGpio()
+        sensor = MAX31856(hardware_spi=_FakeSpi(), gpio=gpio, drdy=24)
+
+        with self.assertRaises(RuntimeError):
+            sensor.wait_for_drdy(timeout=0.01)
+
+        gpio.drdy_low = True
+        sensor.wait_for_drdy(timeout=0.01)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -49,8 +49,8 @@ sensor = MAX31856(hardware_spi=Adafruit_GPIO.SPI.SpiDev(SPI_PORT, SPI_DEVICE))
 # Loop printing measurements every second.
 print('Press Ctrl-C to quit.')
 while True:
-    temp = sensor.read_temp_c()
-    internal = sensor.read_internal_temp_c()
+    # Both temperatures are read in one SPI transfer
+    temp, internal, _ = sensor.read_temperatures()
     print('Thermocouple Temperature: {0:0.3F}*C'.format(temp))
     print('    Internal Temperature: {0:0.3F}*C'.format(internal))
     time.sleep(1.0)
@@ -41,16 +41,24 @@ _logger = logging.getLogger(__name__)
 #software_spi = {"clk": 25, "cs": 8, "do": 9, "di": 10}
 #sensor = MAX31856(software_spi=software_spi, tc_type=MAX31856.MAX31856_K_TYPE)
 
+# Data ready pin.  Connect the board's DRDY output to a GPIO pin and set its number here to read
+# each new conversion (approx. every 100ms) as soon as it is ready, leave as None to poll every second.
+DRDY_PIN = None
+
 # Raspberry Pi hardware SPI configuration.
 SPI_PORT   = 0
 SPI_DEVICE = 0
-sensor = MAX31856(hardware_spi=Adafruit_GPIO.SPI.SpiDev(SPI_PORT, SPI_DEVICE), tc_type=MAX31856.MAX31856_K_TYPE)
+sensor = MAX31856(hardware_spi=Adafruit_GPIO.SPI.SpiDev(SPI_PORT, SPI_DEVICE), tc_type=MAX31856.MAX31856_K_TYPE,
+                  drdy=DRDY_PIN)
 
-# Loop printing measurements every second.
+# Loop printing measurements as they are ready, or every second without the DRDY pin.
 print('Press Ctrl-C to quit.')
 while True:
-    temp = sensor.read_temp_c()
-    internal = sensor.read_internal_temp_c()
+    if DRDY_PIN is None:
+        time.sleep(1.0)
+    else:
+        sensor.wait_for_drdy()
+    # Both temperatures are read in one SPI transfer
+    temp, internal, _ = sensor.read_temperatures()
     print('Thermocouple Temperature: {0:0.3F}*C'.format(temp))
     print('    Internal Temperature: {0:0.3F}*C'.format(internal))
-    time.sleep(1.0)
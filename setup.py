@@ -17,4 +17,6 @@ setup(name              = 'Adafruit_MAX31856',
       url               = 'https://github.com/johnrbnsn/Adafruit_Python_MAX31856/',
       dependency_links  = ['https://github.com/adafruit/Adafruit_Python_GPIO/tarball/master#egg=Adafruit-GPIO-0.6.5'],
       install_requires  = ['Adafruit-GPIO>=0.6.5'],
+      extras_require    = {'numba': ['numba', 'numpy'], 'numpy': ['numpy'], 'pigpio': ['pigpio']},
+      python_requires   = '>=3.7',
       packages          = find_packages())